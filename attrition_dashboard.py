@@ -1,44 +1,356 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import orjson
 import pandas as pd
-import plotly.express as px
-from dash import Dash, dcc, html, Input, Output
+import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv
+from dash import Dash, ctx, dcc, html, Input, Output
 import dash_bootstrap_components as dbc
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+
+# numba is opt-in and deliberately not in requirements.txt: install it to JIT the
+# kernels below; without it (e.g. the gunicorn deploy) the NumPy versions run
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# column assignment on filtered slices shares memory instead of copying
+pd.set_option("mode.copy_on_write", True)
+
+
+CSV_PATH = Path("HRDataset.csv")
+# processed copy of the CSV, rebuilt whenever the CSV or this module is newer
+PARQUET_PATH = Path("HRDataset.parquet")
+
+# the only CSV columns the dashboard reads
+CSV_COLUMNS = ["Employee_Name", "Department", "Sex", "DateofTermination", "Termd",
+               "EmploymentStatus", "TermReason", "Salary", "EngagementSurvey"]
 
 
 def load_and_process_data():
-    df = pd.read_csv("HRDataset.csv")
+    sources_mtime = max(CSV_PATH.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if PARQUET_PATH.exists() and PARQUET_PATH.stat().st_mtime >= sources_mtime:
+        return restore_dtypes(pd.read_parquet(PARQUET_PATH))
+
+    df = load_csv()
+    # write-then-rename so concurrent workers never read a partial file
+    tmp_path = PARQUET_PATH.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, PARQUET_PATH)
+    except OSError:
+        # read-only checkout or full disk: drop any partial file, keep serving from the CSV
+        tmp_path.unlink(missing_ok=True)
+    return df
+
 
-    #group smaller departments
-    df["Department"] = df["Department"].replace({
+def restore_dtypes(df):
+    """Put back the Arrow string dtypes that load_csv produces but Parquet reads back as plain strings/objects."""
+    arrow_str = pd.ArrowDtype(pa.string())
+    df["Employee_Name"] = df["Employee_Name"].astype(arrow_str)
+    for col in ("Sex", "EmploymentStatus", "TermReason"):
+        # rename keeps the codes, only the label dtype changes
+        df[col] = df[col].cat.rename_categories(df[col].cat.categories.astype(arrow_str))
+    return df
+
+
+def load_csv():
+    # multithreaded Arrow parse in 1 MiB blocks, projected to the columns above
+    tbl = csv.read_csv(
+        CSV_PATH,
+        read_options=csv.ReadOptions(use_threads=True, block_size=1 << 20),
+        convert_options=csv.ConvertOptions(
+            include_columns=CSV_COLUMNS,
+            column_types={"Termd": "bool", "Salary": "float32"},
+            # empty cells are missing, as with pd.read_csv, not "" labels
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+    # strip padded labels ("M ", "Production       ") with Arrow's string kernel;
+    # whitespace-only cells trim to "" and become missing too
+    for col in ("Sex", "Department"):
+        trimmed = pc.utf8_trim_whitespace(tbl[col])
+        trimmed = pc.if_else(pc.equal(trimmed, ""), pa.scalar(None, pa.string()), trimmed)
+        tbl = tbl.set_column(tbl.schema.get_field_index(col), col, trimmed)
+    # a blank Termd is read as not terminated rather than failing the bool mask below
+    tbl = tbl.set_column(tbl.schema.get_field_index("Termd"), "Termd", pc.fill_null(tbl["Termd"], False))
+    # fixed m/d/Y layout parsed in Arrow; blanks and malformed dates become null (errors="coerce")
+    col = "DateofTermination"
+    tbl = tbl.set_column(tbl.schema.get_field_index(col), col,
+                         pc.strptime(tbl[col], format="%m/%d/%Y", unit="s", error_is_null=True))
+    df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+
+    #Data changes
+    df["DateofTermination"] = df["DateofTermination"].astype("datetime64[ns]")
+    df["TerminationYear"] = df["DateofTermination"].dt.year.astype("Int16")
+    df['TerminationMonth'] = df['DateofTermination'].dt.month.astype("Int8")
+    # display form for the recent-terminations table, formatted once
+    df["DateofTerminationStr"] = df["DateofTermination"].dt.strftime("%Y-%m-%d").fillna("")
+
+    # low-cardinality labels as categoricals (integer codes instead of objects)
+    for col in ("Department", "Sex", "EmploymentStatus", "TermReason"):
+        df[col] = df[col].astype("category")
+
+    #group smaller departments (relabels the category index, not every row)
+    df["Department"] = merge_categories(df["Department"], {
         "Admin Offices": "Admin and Executive Offices",
         "Executive Office": "Admin and Executive Offices",
         "Executive Offices": "Admin and Executive Offices"
     })
-    #Data changes
-    df['Sex'] = df["Sex"].str.strip()
-    df['Department'] = df['Department'].str.strip()
-    df['DateofHire'] = pd.to_datetime(df["DateofHire"], errors="coerce")
-    df["DateofTermination"] = pd.to_datetime(df["DateofTermination"], errors="coerce")
-    df["TerminationYear"] = df["DateofTermination"].dt.year
-    df['TerminationMonth'] = df['DateofTermination'].dt.month
-    df['HireYear'] = df["DateofHire"].dt.year
 
     return df
 
+
+def merge_categories(series, mapping):
+    """Relabel a categorical through mapping, folding categories that end up with the same label."""
+    labels = pd.Index([mapping.get(c, c) for c in series.cat.categories])
+    merged = labels.unique().sort_values()
+    remap = merged.get_indexer(labels)
+    codes = series.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, merged), index=series.index, name=series.name)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (ndarrays serialize natively)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def prejson(fig):
+    """Serialize a figure once so Dash (and the cache) handle a plain dict."""
+    return orjson.loads(pio.to_json(fig, engine="orjson"))
+
+
+def make_table(headers, rows):
+    """Small striped table built directly from header/row sequences."""
+    return dbc.Table([
+        html.Thead([html.Tr([html.Th(h) for h in headers])]),
+        html.Tbody([html.Tr([html.Td(str(v)) for v in row]) for row in rows]),
+    ], striped=True, bordered=True, hover=True, size="sm")
+
+
+def cube_codes(codes, n):
+    """Cube axis positions for category codes; missing values (-1) go to the extra slot n."""
+    return np.where(codes >= 0, codes, n)
+
+
+def axis_mask(values, selected):
+    """Selection along a cube axis; an empty selection keeps every slot."""
+    if not selected:
+        return np.ones(len(values) + 1, dtype=bool)
+    return np.append(np.isin(values, selected), False)
+
+
+def cube_by_dept(cube, termd, sex, year, status):
+    """Sum one Termd side of a cube over the sex/year/status selections, per department slot."""
+    sel = sex[:, None, None] & year[None, :, None] & status[None, None, :]
+    return np.where(sel, cube[..., termd], 0).sum(axis=(1, 2, 3))
+
+
+def any_of(masks, selected):
+    """Union of the precomputed row masks for the selected values."""
+    return np.logical_or.reduce([masks.get(v, NO_ROWS) for v in selected])
+
+
+def breakdown_counts(row_mask, dept_codes, sex_codes, reason_codes, sizes):
+    """Department, gender and reason counts over the masked rows (missing labels skipped)."""
+    counts = []
+    for codes, n in zip((dept_codes, sex_codes, reason_codes), sizes):
+        selected = codes[row_mask]
+        counts.append(np.bincount(selected[selected >= 0], minlength=n))
+    return tuple(counts)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def breakdown_counts(row_mask, dept_codes, sex_codes, reason_codes, sizes):
+        # one scan of the mask fills all three histograms
+        dept = np.zeros(sizes[0], np.int64)
+        sex = np.zeros(sizes[1], np.int64)
+        reason = np.zeros(sizes[2], np.int64)
+        for i in range(row_mask.size):
+            if row_mask[i]:
+                if dept_codes[i] >= 0:
+                    dept[dept_codes[i]] += 1
+                if sex_codes[i] >= 0:
+                    sex[sex_codes[i]] += 1
+                if reason_codes[i] >= 0:
+                    reason[reason_codes[i]] += 1
+        return dept, sex, reason
+
+
+def bin_year_month(year_idx, month, n_years):
+    """Termination counts on a dense (n_years, 12) year x month grid (months outside 1-12 skipped)."""
+    valid = (month >= 1) & (month <= 12)
+    cells = year_idx[valid] * 12 + (month[valid] - 1)
+    return np.bincount(cells, minlength=n_years * 12).reshape(n_years, 12)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def bin_year_month(year_idx, month, n_years):
+        # single scan; serial on purpose, parallel increments into out would race
+        out = np.zeros((n_years, 12), np.int64)
+        for i in range(year_idx.size):
+            # numba does no bounds checks: month 0 would wrap to December
+            if 1 <= month[i] <= 12:
+                out[year_idx[i], month[i] - 1] += 1
+        return out
+
+
+def cum_rates(grid, headcount):
+    """Running per-year termination counts as a percentage of headcount."""
+    return grid.cumsum(axis=1) / headcount * 100
+
+
+if njit is not None:
+    @njit(cache=True)
+    def cum_rates(grid, headcount):
+        # cumsum and scaling fused into one pass over the grid
+        out = np.empty(grid.shape, np.float64)
+        for j in range(grid.shape[0]):
+            acc = 0
+            for m in range(grid.shape[1]):
+                acc += grid[j, m]
+                out[j, m] = acc / headcount * 100
+        return out
+
 # pull Data
 df = load_and_process_data()
 
+# contiguous arrays for the filter columns, so callbacks mask raw ndarrays
+TERMD_ARR = df["Termd"].to_numpy(bool)
+TY_ARR = df["TerminationYear"].fillna(-1).to_numpy(np.int16)
+TM_ARR = df["TerminationMonth"].fillna(0).to_numpy(np.int8)
+
+# display columns for the recent-terminations table
+RECENT_HEADERS = ["Employee_Name", "Department", "TermReason", "DateofTermination"]
+RECENT_ARRS = [df[col].to_numpy(dtype=object, na_value="")
+               for col in ("Employee_Name", "Department", "TermReason", "DateofTerminationStr")]
+RECENT_PAGE_SIZE = 10
+
+# shared figure styling, built once
+TRANSPARENT = {"paper_bgcolor": "rgba(0,0,0,0)", "plot_bgcolor": "rgba(0,0,0,0)"}
+MONTH_TICKVALS = list(range(1, 13))
+MONTH_TICKTEXT = [pd.Timestamp(2000, m, 1).strftime("%b") for m in MONTH_TICKVALS]
+
+# filter-invariant figure layouts; callbacks only attach fresh traces
+LAYOUT_NO_DATA = go.Layout(title="No Data", **TRANSPARENT)
+LAYOUT_TIMELINE = go.Layout(
+    template="plotly_dark",
+    title="Cumulative Termination Rate (%) by Month per Year",
+    legend_title_text="TerminationYear",
+    xaxis={"tickvals": MONTH_TICKVALS, "ticktext": MONTH_TICKTEXT, "title": "Month of Termination"},
+    yaxis={"title": "Cumulative Termination Rate (%)", "tickformat": ".1f"},
+    **TRANSPARENT,
+)
+LAYOUT_GENDER = go.Layout(template="plotly_dark", margin_t=60, **TRANSPARENT)
+LAYOUT_DEPT = go.Layout(template="plotly_dark", margin_t=60, xaxis_title="Count", yaxis_title="Department",
+                        **TRANSPARENT)
+LAYOUT_REASON = go.Layout(template="plotly_dark", margin_t=60, xaxis_title="Count", yaxis_title="Reason",
+                          **TRANSPARENT)
+LAYOUT_ENGAGEMENT = go.Layout(
+    template="plotly_dark",
+    title="Average Engagement Survey Scores by Department",
+    barmode="group",
+    legend_title_text="Status",
+    xaxis_title="Department", yaxis_title="Avg Engagement Score",
+    xaxis_tickangle=-25,
+    **TRANSPARENT,
+)
+ENGAGEMENT_COLORS = {"Active Employees": "lightblue", "Terminated Employees": "orange"}
+
+# category codes for the bincount-based breakdown charts
+DEPT_CATS = df["Department"].cat.categories
+DEPT_CODES = df["Department"].cat.codes.to_numpy()
+SEX_CATS = df["Sex"].cat.categories
+SEX_CODES = df["Sex"].cat.codes.to_numpy()
+REASON_CATS = df["TermReason"].cat.categories
+REASON_CODES = df["TermReason"].cat.codes.to_numpy()
+STATUS_CATS = df["EmploymentStatus"].cat.categories
+STATUS_CODES = df["EmploymentStatus"].cat.codes.to_numpy()
+BREAKDOWN_SIZES = (len(DEPT_CATS), len(SEX_CATS), len(REASON_CATS))
+
+# row positions by termination date, newest first (rows without a date excluded)
+_term_dates = df["DateofTermination"].to_numpy()
+_dated = np.flatnonzero(~np.isnat(_term_dates))
+SORTED_IDX = _dated[np.argsort(-_term_dates[_dated].view("i8"), kind="stable")]
+
+# engagement scores with missing answers zeroed and flagged, for weighted bincounts
+_eng = df["EngagementSurvey"].to_numpy(np.float64, na_value=np.nan)
+ENG_VALID = ~np.isnan(_eng)
+ENG_ARR = np.where(ENG_VALID, _eng, 0.0)
+
+# salaries likewise, so a blank salary drops out of the averages instead of turning them NaN
+_sal = df["Salary"].to_numpy(np.float64, na_value=np.nan)
+SAL_VALID = ~np.isnan(_sal)
+SAL_ARR = np.where(SAL_VALID, _sal, 0.0)
+
 # lists for dropdowns
-DEPARTMENTS = sorted(df["Department"].dropna().unique())
-GENDERS = sorted(df["Sex"].dropna().unique())
+DEPARTMENTS = list(df["Department"].cat.categories)
+GENDERS = list(df["Sex"].cat.categories)
 YEARS = sorted(df["TerminationYear"].dropna().unique())
 MIN_YEAR = int(min(YEARS)) if YEARS else 2010
 MAX_YEAR = int(max(YEARS)) if YEARS else 2025
 
+# one precomputed row mask per filter value; callbacks OR together the selected ones
+# (compared on codes, so missing labels (-1) match nothing)
+NO_ROWS = np.zeros(len(df), dtype=bool)
+DEPT_MASKS = {d: DEPT_CODES == i for i, d in enumerate(DEPT_CATS)}
+SEX_MASKS = {g: SEX_CODES == i for i, g in enumerate(SEX_CATS)}
+STATUS_MASKS = {s: STATUS_CODES == i for i, s in enumerate(STATUS_CATS)}
+
+# dense aggregate cube over (Department, Sex, TerminationYear, EmploymentStatus, Termd),
+# built once so KPI/salary/engagement outputs cost O(cells) instead of O(rows)
+CUBE_YEARS = np.array(YEARS, dtype=np.int16)
+CUBE_SHAPE = (len(DEPT_CATS) + 1, len(SEX_CATS) + 1, len(CUBE_YEARS) + 1, len(STATUS_CATS) + 1, 2)
+_cells = np.ravel_multi_index((
+    cube_codes(DEPT_CODES, len(DEPT_CATS)),
+    cube_codes(SEX_CODES, len(SEX_CATS)),
+    np.where(TY_ARR >= 0, np.searchsorted(CUBE_YEARS, TY_ARR), len(CUBE_YEARS)),
+    cube_codes(STATUS_CODES, len(STATUS_CATS)),
+    TERMD_ARR.astype(np.intp),
+), CUBE_SHAPE)
+CUBES = {
+    name: np.bincount(_cells, weights=weights, minlength=np.prod(CUBE_SHAPE)).reshape(CUBE_SHAPE)
+    for name, weights in (
+        ("n", None),
+        ("salary", SAL_ARR),
+        ("salary_n", SAL_VALID.astype(np.float64)),
+        ("eng", ENG_ARR),
+        ("eng_n", ENG_VALID.astype(np.float64)),
+    )
+}
+EVERY_YEAR = np.ones(CUBE_SHAPE[2], dtype=bool)
+EVERY_STATUS = np.ones(CUBE_SHAPE[3], dtype=bool)
+
 #style & title
 app = Dash(__name__, external_stylesheets=[dbc.themes.SOLAR])
 server = app.server
 app.title = "HR Attrition Dashboard"
 
+# orjson for Flask's request/response JSON; Dash serializes callback
+# output through plotly.io, so pin that to orjson as well
+server.json = OrjsonProvider(server)
+pio.json.config.default_engine = "orjson"
+
+# per-process memo of callback results; use RedisCache to share across workers
+cache = Cache(server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 600})
+
 #layout
 app.layout = dbc.Container([
 
@@ -200,7 +512,9 @@ app.layout = dbc.Container([
         dbc.Col([
             dbc.Card(dbc.CardBody([
             html.H5("Recent Terminations"),
-            html.Div(id="table-recent-terms")
+            html.Div(id="table-recent-terms"),
+            dbc.Pagination(id="recent-terms-page", max_value=1, active_page=1, size="sm",
+                           fully_expanded=False, previous_next=True, className="d-none")
         ]))
     ], width=12),
 ], className="mb-4"),
@@ -208,215 +522,272 @@ app.layout = dbc.Container([
 ])
 
 # Callbacks
+FILTER_INPUTS = [
+    Input("dept-filter", "value"),
+    Input("gender-filter", "value"),
+    Input("year-filter", "value"),
+    Input('termination-filter','value'),
+]
+
+
+def filter_key(depts, genders, year_range, termination_filter):
+    # sorted tuples so equivalent selections share one cache entry
+    return (
+        tuple(sorted(depts or ())),
+        tuple(sorted(genders or ())),
+        tuple(year_range) if year_range else None,
+        tuple(sorted(termination_filter or ())),
+    )
+
+
+@cache.memoize()
+def filter_masks(key):
+    """Row masks for the filtered population and its terminations."""
+    depts, genders, year_range, termination_filter = key
+
+    # Apply Filters (OR of precomputed per-value masks, then AND across filters)
+    mask = np.ones(len(df), dtype=bool)
+    if depts:
+        mask &= any_of(DEPT_MASKS, depts)
+    if genders:
+        mask &= any_of(SEX_MASKS, genders)
+
+    # Terminations under the status/year filters
+    tmask = mask & TERMD_ARR
+
+    if termination_filter:
+        tmask &= any_of(STATUS_MASKS, termination_filter)
+
+    if year_range:
+        tmask &= (TY_ARR >= year_range[0]) & (TY_ARR <= year_range[1])
+
+    return mask, tmask
+
+
+@cache.memoize()
+def filter_aggregates(key):
+    """Headcount plus per-department cube sums for the filtered active staff and terminations."""
+    depts, genders, year_range, termination_filter = key
+    dept = axis_mask(DEPT_CATS, depts)
+    sex = axis_mask(SEX_CATS, genders)
+    status = axis_mask(STATUS_CATS, termination_filter)
+    if year_range:
+        year = np.append((CUBE_YEARS >= year_range[0]) & (CUBE_YEARS <= year_range[1]), False)
+    else:
+        year = EVERY_YEAR
+
+    active = {name: cube_by_dept(cube, 0, sex, EVERY_YEAR, EVERY_STATUS) * dept for name, cube in CUBES.items()}
+    term = {name: cube_by_dept(cube, 1, sex, year, status) * dept for name, cube in CUBES.items()}
+    all_term = cube_by_dept(CUBES["n"], 1, sex, EVERY_YEAR, EVERY_STATUS) * dept
+    headcount = int(active["n"].sum() + all_term.sum())
+    return headcount, active, term
+
+
+## TOP OVERALL METRICS
 @app.callback(
     [
         Output('kpi-total', "children"),
         Output("kpi-active", "children"),
         Output('kpi-terminated', "children"),
         Output("kpi-rate", "children"),
-        Output("chart-attrition-year", "figure"),
-        Output("chart-attrition-gender", "figure"),
-        Output("chart-attrition-dept", "figure"),
-        Output("chart-termination-reason", "figure"),
-        Output("table-salary", "children"),
-        Output("table-recent-terms", "children"),
-        Output('engagement-score','figure'),
     ],
-
-    [
-        Input("dept-filter", "value"),
-        Input("gender-filter", "value"),
-        Input("year-filter", "value"),
-        Input('termination-filter','value'),
-    ]
+    FILTER_INPUTS,
 )
-def update_dashboard(depts, genders, year_range, termination_filter):
+def update_kpis(*filters):
+    return compute_kpis(filter_key(*filters))
 
-    # make a copy
-    dff = df.copy()
 
-    # Apply Filters
-    if depts:
-        dff = dff[dff["Department"].isin(depts)]
-    if genders:
-        dff = dff[dff["Sex"].isin(genders)]
-
-    # Split into Active/Terminated
-    dff_active = dff[dff["Termd"] == 0]
-    dff_term = dff[dff["Termd"] == 1]
+@cache.memoize()
+def compute_kpis(key):
+    count_total, _, term = filter_aggregates(key)
 
-    if termination_filter:
-        dff_term = dff_term[
-            dff_term["EmploymentStatus"].isin(termination_filter)
-    ]
-        
-    if year_range:
-        dff_term = dff_term[
-            (dff_term["TerminationYear"] >= year_range[0]) &
-            (dff_term["TerminationYear"] <= year_range[1])
-            ]
-
-    ## TOP OVERALL METRICS
-    count_term = len(dff_term)
-    count_total = len(dff)
+    count_term = int(term["n"].sum())
     count_active = count_total - count_term
     rate = round((count_term / count_total * 100), 1) if count_total > 0 else 0
 
-    ## ATTRITION CHARTS
-    #Timeline (cumulative)
-    total_headcount = len(dff)
-    if not dff_term.empty and total_headcount > 0:
-        #all years
-        present_years = dff_term['TerminationYear'].unique()
-
-        #monthly terms
-        actual_terminations = dff_term.groupby(["TerminationYear", "TerminationMonth"]).size().reset_index(
-            name="MonthlyTerminations")
-
-        #index the months
-        all_months = range(1, 13)
-        complete_index_data = [
-            (year, month)
-            for year in present_years
-            for month in all_months
-        ]
-
-        complete_index = pd.DataFrame(
-            complete_index_data,
-            columns=['TerminationYear', 'TerminationMonth']
-        )
-        timeline_df = pd.merge(
-            complete_index,
-            actual_terminations,
-            on=['TerminationYear', 'TerminationMonth'],
-            how='left'
-        ).fillna(0)
+    return str(count_total), str(count_active), str(count_term), f"{rate}%"
 
-        #change to integer
-        timeline_df['MonthlyTerminations'] = timeline_df['MonthlyTerminations'].astype(int)
+
+## ATTRITION CHARTS
+@app.callback(Output("chart-attrition-year", "figure"), FILTER_INPUTS)
+def update_timeline(*filters):
+    return compute_timeline(filter_key(*filters))
+
+
+@cache.memoize()
+def compute_timeline(key):
+    mask, tmask = filter_masks(key)
+
+    #Timeline (cumulative)
+    total_headcount = int(mask.sum())
+    # only dated terminations have a year/month to plot (undated rows carry -1/0 placeholders)
+    dated = tmask & (TY_ARR >= 0)
+    if dated.any() and total_headcount > 0:
+        #monthly terms on a dense (year x month) grid
+        ty = TY_ARR[dated]
+        tm = TM_ARR[dated]
+        years, year_idx = np.unique(ty, return_inverse=True)
+        grid = bin_year_month(year_idx, tm, years.size)
 
         #Calculate cumm. term rate
-        timeline_df['CumulativeTerminations'] = timeline_df.groupby('TerminationYear')['MonthlyTerminations'].cumsum()
-        timeline_df['CumulativeRate'] = (timeline_df['CumulativeTerminations'] / total_headcount) * 100
-
-        #structure
-        timeline_df["TerminationYear"] = timeline_df["TerminationYear"].astype(str)
-        ordered_years = sorted(present_years, reverse=True)
-        ordered_years_str = [str(y) for y in ordered_years]
-
-        # Create line chart
-        fig_year = px.line(
-            timeline_df,
-            x='TerminationMonth',
-            y='CumulativeRate',
-            color='TerminationYear',
-            markers=True,
-            title='Cumulative Termination Rate (%) by Month per Year',
-            template='plotly_dark',
-            category_orders={"TerminationYear": ordered_years_str}
-        )
-        month_names = {i: pd.to_datetime(i, format="%m").strftime("%b") for i  in range(1, 13)}
-        fig_year.update_xaxes(
-            tickvals=list(range(1, 13 )),
-            ticktext=list(month_names.values()),
-            title='Month of Termination'
-        )
-        fig_year.update_yaxes(title="Cumulative Termination Rate (%)", tickformat=".1f")
+        rates = cum_rates(grid, total_headcount)
+
+        # one line per year, newest first
+        fig_year = go.Figure([
+            go.Scatter(
+                x=MONTH_TICKVALS, y=row, mode="lines+markers", name=str(year), showlegend=True,
+                hovertemplate=f"TerminationYear={year}<br>TerminationMonth=%{{x}}<br>CumulativeRate=%{{y}}<extra></extra>",
+            )
+            for year, row in zip(years[::-1], rates[::-1])
+        ], LAYOUT_TIMELINE)
 
     else:
-        fig_year = px.line(title="No Data")
+        fig_year = go.Figure(layout=LAYOUT_NO_DATA)
 
+    return prejson(fig_year)
 
-    #Gender Pie
-    fig_gender = px.pie(
-        dff_term, names="Sex", hole=0.4,
-        color_discrete_map={"M": "#3498db", "F": "#e74c3c"},template='plotly_dark',)
 
+@app.callback(
+    [
+        Output("chart-attrition-gender", "figure"),
+        Output("chart-attrition-dept", "figure"),
+        Output("chart-termination-reason", "figure"),
+    ],
+    FILTER_INPUTS,
+)
+def update_breakdowns(*filters):
+    return compute_breakdowns(filter_key(*filters))
+
+
+@cache.memoize()
+def compute_breakdowns(key):
+    _, tmask = filter_masks(key)
 
+    # all three breakdowns from one pass over the termination mask
+    dept_hist, sex_hist, reason_hist = breakdown_counts(
+        tmask, DEPT_CODES, SEX_CODES, REASON_CODES, BREAKDOWN_SIZES)
+    has_terms = tmask.any()
+
+    #Gender Pie
+    present = sex_hist > 0
+    fig_gender = go.Figure(go.Pie(
+        labels=SEX_CATS[present], values=sex_hist[present], hole=0.4,
+        hovertemplate="Sex=%{label}<br>Count=%{value}<extra></extra>",
+    ), LAYOUT_GENDER)
 
     #Dept Bar
-    if not dff_term.empty:
-        dept_counts = dff_term["Department"].value_counts().reset_index()
-        dept_counts.columns = ["Department", "Count"]
-        fig_dept = px.bar(dept_counts, x="Count", y="Department", orientation='h',template='plotly_dark')
+    if has_terms:
+        counts = dept_hist
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0]
+        fig_dept = go.Figure(go.Bar(
+            x=counts[order], y=DEPT_CATS[order], orientation="h",
+            hovertemplate="Count=%{x}<br>Department=%{y}<extra></extra>",
+        ), LAYOUT_DEPT)
     else:
-        fig_dept = px.bar(title="No Data")
+        fig_dept = go.Figure(layout=LAYOUT_NO_DATA)
 
     #Reasons
-    if not dff_term.empty:
-        reasons = dff_term["TermReason"].value_counts().nlargest(10).reset_index()
-        reasons.columns = ["Reason", "Count"]
-        fig_reason = px.bar(reasons, x="Count", y="Reason", orientation='h', template="plotly_dark")
+    if has_terms:
+        counts = reason_hist
+        # stable sort: reasons tied at 10th place are cut in category order
+        top = np.argsort(-counts, kind="stable")[:10]
+        top = top[counts[top] > 0]
+        fig_reason = go.Figure(go.Bar(
+            x=counts[top], y=REASON_CATS[top], orientation="h",
+            hovertemplate="Count=%{x}<br>Reason=%{y}<extra></extra>",
+        ), LAYOUT_REASON)
     else:
-        fig_reason = px.bar(title="No Data")
+        fig_reason = go.Figure(layout=LAYOUT_NO_DATA)
 
-    # # transparent backgrounds
-    # for fig in [fig_year, fig_gender, fig_dept, fig_reason]:
-    #     fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
+    return prejson(fig_gender), prejson(fig_dept), prejson(fig_reason)
 
-    # row 4 tables
 
-    #Salary Table
-    avg_active = dff_active["Salary"].mean() if not dff_active.empty else 0
-    avg_term = dff_term["Salary"].mean() if not dff_term.empty else 0
+# engagement reads the aggregate cube only, so it runs apart from the row-mask breakdowns
+@app.callback(Output('engagement-score','figure'), FILTER_INPUTS)
+def update_engagement(*filters):
+    return compute_engagement(filter_key(*filters))
 
-    salary_data = pd.DataFrame({
-        "Status": ["Active", "Terminated"],
-        "Avg Salary": [f"${avg_active:,.2f}", f"${avg_term:,.2f}"]
-    })
 
+@cache.memoize()
+def compute_engagement(key):
+    #ENGAGEMENT SURVEY SCORES (per-department means from the aggregate cube)
+    _, active, term = filter_aggregates(key)
+    avg_engage_active, avg_engage_term = (
+        np.divide(sums["eng"], sums["eng_n"], out=np.zeros(sums["eng"].size), where=sums["eng_n"] > 0)
+        for sums in (active, term)
+    )
 
-    table_salary = dbc.Table.from_dataframe(salary_data, striped=True, bordered=True, hover=True, size="sm")
+    # departments present in either group, one grouped bar per status
+    present = np.flatnonzero((active["n"][:-1] > 0) | (term["n"][:-1] > 0))
+    departments = DEPT_CATS[present]
 
-    #ENGAGEMENT SURVEY SCORES
-    avg_engage_active = (dff_active.groupby('Department')['EngagementSurvey'].mean()
-    .reset_index(name='ActiveEngagement'))
-    avg_engage_term= (dff_term.groupby('Department')["EngagementSurvey"].mean()
-    .reset_index(name='TermEngagement'))
+    #build visual
+    fig_engagement = go.Figure([
+        go.Bar(
+            x=departments, y=avg[present], name=status, showlegend=True,
+            marker_color=ENGAGEMENT_COLORS[status],
+            hovertemplate=f"Status={status}<br>Department=%{{x}}<br>AvgEngagement=%{{y}}<extra></extra>",
+        )
+        for status, avg in (("Active Employees", avg_engage_active), ("Terminated Employees", avg_engage_term))
+        if present.size
+    ], LAYOUT_ENGAGEMENT)
 
- 
-    
-    engagement_data = pd.merge(avg_engage_active,avg_engage_term, on="Department",how="outer").fillna(0)
+    return prejson(fig_engagement)
 
-    eng_long = engagement_data.melt(id_vars='Department',value_vars=['ActiveEngagement', 'TermEngagement'],
-                                    var_name='Status', value_name='AvgEngagement')
 
-    eng_long["Status"] = eng_long['Status'].replace({'ActiveEngagement': 'Active Employees',
-                                                     'TermEngagement': 'Terminated Employees'})
+# salary comparison table
+@app.callback(Output("table-salary", "children"), FILTER_INPUTS)
+def update_salary(*filters):
+    return compute_salary(filter_key(*filters))
 
-    #build visual
-    
-                                    
-    fig_engagement = px.bar(
-    eng_long,
-    x="Department", y="AvgEngagement", 
-    color="Status", barmode="group", 
-    template="plotly_dark", 
-    title="Average Engagement Survey Scores by Department", 
-    color_discrete_map={"Active Employees": "lightblue", "Terminated Employees": "orange"}
-)
-    fig_engagement.update_layout(
-        xaxis_title="Department",  yaxis_title="Avg Engagement Score", 
-        xaxis_tickangle=-25 
-)
-    
-    # transparent backgrounds
-    for fig in [fig_year, fig_gender, fig_dept, fig_reason,fig_engagement]:
-        fig.update_layout(paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
 
+@cache.memoize()
+def compute_salary(key):
+    #Salary Table
+    _, active, term = filter_aggregates(key)
+    n_active, n_term = active["salary_n"].sum(), term["salary_n"].sum()
+    avg_active = active["salary"].sum() / n_active if n_active else 0.0
+    avg_term = term["salary"].sum() / n_term if n_term else 0.0
 
-    # Recent Terms Table
-    if not dff_term.empty:
-        recent_df = dff_term.sort_values('DateofTermination', ascending=False).head(10)
-        recent_df = recent_df[['Employee_Name', 'Department', "TermReason", 'DateofTermination']]
-        recent_df["DateofTermination"] = recent_df['DateofTermination'].dt.strftime('%Y-%m-%d')
-        table_recent = dbc.Table.from_dataframe(recent_df, striped=True, bordered=True, hover=True, size='sm')
-    else:
-        table_recent = html.Div('No terminations found matching criteria.', className='text-muted p-2')
+    return make_table(["Status", "Avg Salary"], [
+        ["Active", f"${avg_active:,.2f}"],
+        ["Terminated", f"${avg_term:,.2f}"],
+    ])
 
-    
-    return str(count_total), str(count_active), str(
-        count_term), f"{rate}%", fig_year, fig_gender, fig_dept, fig_reason, table_salary, table_recent, fig_engagement
+
+# recent terminations, paged on the server: only the visible page is rendered
+@app.callback(
+    [
+        Output("table-recent-terms", "children"),
+        Output("recent-terms-page", "max_value"),
+        Output("recent-terms-page", "active_page"),
+        Output("recent-terms-page", "className"),
+    ],
+    FILTER_INPUTS + [Input("recent-terms-page", "active_page")],
+)
+def update_recent_terms(*inputs):
+    *filters, page = inputs
+    # a filter change starts over from the newest terminations
+    if ctx.triggered_id != "recent-terms-page":
+        page = 1
+    return compute_recent_terms(filter_key(*filters), page or 1)
+
+
+@cache.memoize()
+def compute_recent_terms(key, page):
+    _, tmask = filter_masks(key)
+
+    # filtered positions, still newest first
+    recent_idx = SORTED_IDX[tmask[SORTED_IDX]]
+    if not recent_idx.size:
+        return html.Div('No terminations found matching criteria.', className='text-muted p-2'), 1, 1, "d-none"
+
+    n_pages = -(-recent_idx.size // RECENT_PAGE_SIZE)
+    page = min(page, n_pages)
+    page_idx = recent_idx[(page - 1) * RECENT_PAGE_SIZE:page * RECENT_PAGE_SIZE]
+    table_recent = make_table(RECENT_HEADERS, zip(*(arr[page_idx] for arr in RECENT_ARRS)))
+    return table_recent, n_pages, page, "mt-2" if n_pages > 1 else "d-none"
     
 
 if __name__ == "__main__":